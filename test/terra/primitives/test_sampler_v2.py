@@ -32,123 +32,141 @@ from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 
 from test.terra.common import QiskitAerTestCase
 
-from qiskit_aer import AerSimulator
 from qiskit_aer.primitives import SamplerV2
 
 
 class TestSamplerV2(QiskitAerTestCase):
     """Test for SamplerV2"""
 
-    def setUp(self):
-        super().setUp()
-        self._shots = 10000
-        self._seed = 123
-
-        self._cases = []
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # the fixtures below are never mutated by the tests, so they are built once per class
+        # (stestr schedules whole classes on its parallel workers)
+        cls._shots = 10000
+        cls._shots_fast = 1024
+        # shots for circuits whose output is a single known bitstring
+        cls._shots_exact = 64
+        cls._seed = 123
+        cls._sampler = SamplerV2(seed=cls._seed)
+        # transpile against the simulator the sampler runs on rather than constructing another
+        cls._backend = cls._sampler._backend
+        cls._pm = generate_preset_pass_manager(optimization_level=0, backend=cls._backend)
+
+        cls._cases = []
         hadamard = QuantumCircuit(1, 1, name="Hadamard")
         hadamard.h(0)
         hadamard.measure(0, 0)
-        self._cases.append((hadamard, None, {0: 5000, 1: 5000}))  # case 0
+        cls._cases.append((hadamard, None, {0: 5000, 1: 5000}))  # case 0
 
         bell = QuantumCircuit(2, name="Bell")
         bell.h(0)
         bell.cx(0, 1)
         bell.measure_all()
-        self._cases.append((bell, None, {0: 5000, 3: 5000}))  # case 1
-
-        self._backend = AerSimulator()
-        pm = generate_preset_pass_manager(optimization_level=0, backend=self._backend)
+        cls._cases.append((bell, None, {0: 5000, 3: 5000}))  # case 1
 
+        # every circuit that needs transpilation goes through a single pm.run call
         pqc = RealAmplitudes(num_qubits=2, reps=2)
         pqc.measure_all()
-        pqc = pm.run(pqc)
-        self._cases.append((pqc, [0] * 6, {0: 10000}))  # case 2
-        self._cases.append((pqc, [1] * 6, {0: 168, 1: 3389, 2: 470, 3: 5973}))  # case 3
-        self._cases.append((pqc, [0, 1, 1, 2, 3, 5], {0: 1339, 1: 3534, 2: 912, 3: 4215}))  # case 4
-        self._cases.append((pqc, [1, 2, 3, 4, 5, 6], {0: 634, 1: 291, 2: 6039, 3: 3036}))  # case 5
-
         pqc2 = RealAmplitudes(num_qubits=2, reps=3)
         pqc2.measure_all()
-        pqc2 = pm.run(pqc2)
-        self._cases.append(
+        # circuits for test_run_errors; err_qc1 only measures, so it is used as is
+        err_qc1 = QuantumCircuit(1)
+        err_qc1.measure_all()
+        err_qc2 = RealAmplitudes(num_qubits=1, reps=1)
+        err_qc2.measure_all()
+        err_qc3 = QuantumCircuit(1, 1)
+        with err_qc3.for_loop(range(5)):
+            err_qc3.h(0)
+        pqc, pqc2, err_qc2, err_qc3 = cls._pm.run([pqc, pqc2, err_qc2, err_qc3])
+        cls._error_circuits = (err_qc1, err_qc2, err_qc3)
+
+        cls._cases.append((pqc, [0] * 6, {0: 10000}))  # case 2
+        cls._cases.append((pqc, [1] * 6, {0: 168, 1: 3389, 2: 470, 3: 5973}))  # case 3
+        cls._cases.append((pqc, [0, 1, 1, 2, 3, 5], {0: 1339, 1: 3534, 2: 912, 3: 4215}))  # case 4
+        cls._cases.append((pqc, [1, 2, 3, 4, 5, 6], {0: 634, 1: 291, 2: 6039, 3: 3036}))  # case 5
+        cls._cases.append(
             (pqc2, [0, 1, 2, 3, 4, 5, 6, 7], {0: 1898, 1: 6864, 2: 928, 3: 311})
         )  # case 6
 
+        # pre-pack the target counts into dense histograms over all outcomes
+        cls._cases = [
+            (qc, params, _counts_to_array(target, 1 << qc.num_clbits))
+            for qc, params, target in cls._cases
+        ]
+
     def _assert_allclose(self, bitarray: BitArray, target: NDArray | BitArray, rtol=1e-1):
-        self.assertEqual(bitarray.shape, target.shape)
+        # a numeric target holds dense histograms along its last axis,
+        # an object target holds count dictionaries
+        dense = isinstance(target, np.ndarray) and target.dtype != object
+        self.assertEqual(bitarray.shape, target.shape[:-1] if dense else target.shape)
         for idx in np.ndindex(bitarray.shape):
-            int_counts = bitarray.get_int_counts(idx)
-            target_counts = (
-                target.get_int_counts(idx) if isinstance(target, BitArray) else target[idx]
-            )
-            max_key = max(max(int_counts.keys()), max(target_counts.keys()))
-            ary = np.array([int_counts.get(i, 0) for i in range(max_key + 1)])
-            tgt = np.array([target_counts.get(i, 0) for i in range(max_key + 1)])
+            if dense:
+                tgt = target[idx]
+            elif isinstance(target, BitArray):
+                tgt = _histogram(target.array[idx], 1 << target.num_bits)
+            else:
+                tgt = _counts_to_array(target[idx], 1 << bitarray.num_bits)
+            ary = _histogram(bitarray.array[idx], tgt.size)
             np.testing.assert_allclose(ary, tgt, rtol=rtol, err_msg=f"index: {idx}")
 
+    def _assert_standard_result(self, result: PrimitiveResult, num_pubs: int = 1):
+        self.assertIsInstance(result, PrimitiveResult)
+        self.assertIsInstance(result.metadata, dict)
+        self.assertEqual(len(result), num_pubs)
+        for pub_result in result:
+            self.assertIsInstance(pub_result, PubResult)
+            self.assertIsInstance(pub_result.data, DataBin)
+            self.assertIsInstance(pub_result.data.meas, BitArray)
+
     def test_sampler_run(self):
         """Test run()."""
 
         with self.subTest("single"):
             bell, _, target = self._cases[1]
-            sampler = SamplerV2(seed=self._seed)
+            sampler = self._sampler
             job = sampler.run([bell], shots=self._shots)
             result = job.result()
-            self.assertIsInstance(result, PrimitiveResult)
-            self.assertIsInstance(result.metadata, dict)
-            self.assertEqual(len(result), 1)
-            self.assertIsInstance(result[0], PubResult)
-            self.assertIsInstance(result[0].data, DataBin)
-            self.assertIsInstance(result[0].data.meas, BitArray)
+            self._assert_standard_result(result)
             self._assert_allclose(result[0].data.meas, np.array(target))
 
         with self.subTest("single with param"):
             pqc, param_vals, target = self._cases[2]
-            sampler = SamplerV2(seed=self._seed)
-            params = (param.name for param in pqc.parameters)
+            sampler = self._sampler
+            params = tuple(param.name for param in pqc.parameters)
             job = sampler.run([(pqc, {params: param_vals})], shots=self._shots)
             result = job.result()
-            self.assertIsInstance(result, PrimitiveResult)
-            self.assertIsInstance(result.metadata, dict)
-            self.assertEqual(len(result), 1)
-            self.assertIsInstance(result[0], PubResult)
-            self.assertIsInstance(result[0].data, DataBin)
-            self.assertIsInstance(result[0].data.meas, BitArray)
+            self._assert_standard_result(result)
             self._assert_allclose(result[0].data.meas, np.array(target))
 
         with self.subTest("multiple"):
             pqc, param_vals, target = self._cases[2]
-            sampler = SamplerV2(seed=self._seed)
-            params = (param.name for param in pqc.parameters)
+            sampler = self._sampler
+            params = tuple(param.name for param in pqc.parameters)
             job = sampler.run(
                 [(pqc, {params: [param_vals, param_vals, param_vals]})], shots=self._shots
             )
             result = job.result()
-            self.assertIsInstance(result, PrimitiveResult)
-            self.assertIsInstance(result.metadata, dict)
-            self.assertEqual(len(result), 1)
-            self.assertIsInstance(result[0], PubResult)
-            self.assertIsInstance(result[0].data, DataBin)
-            self.assertIsInstance(result[0].data.meas, BitArray)
+            self._assert_standard_result(result)
             self._assert_allclose(result[0].data.meas, np.array([target, target, target]))
 
     def test_sampler_run_multiple_times(self):
         """Test run() returns the same results if the same input is given."""
         bell, _, _ = self._cases[1]
 
-        sampler = SamplerV2(seed=self._seed)
-        result1 = sampler.run([bell], shots=self._shots).result()
+        sampler = self._sampler
+        result1 = sampler.run([bell], shots=self._shots_fast).result()
         meas1 = result1[0].data.meas
-        result2 = sampler.run([bell], shots=self._shots).result()
+        result2 = sampler.run([bell], shots=self._shots_fast).result()
         meas2 = result2[0].data.meas
         self._assert_allclose(meas1, meas2, rtol=0)
 
     def test_sample_run_multiple_circuits(self):
         """Test run() with multiple circuits."""
         bell, _, target = self._cases[1]
-        sampler = SamplerV2(seed=self._seed)
+        sampler = self._sampler
         result = sampler.run([bell, bell, bell], shots=self._shots).result()
-        self.assertEqual(len(result), 3)
+        self._assert_standard_result(result, 3)
         self._assert_allclose(result[0].data.meas, np.array(target))
         self._assert_allclose(result[1].data.meas, np.array(target))
         self._assert_allclose(result[2].data.meas, np.array(target))
@@ -160,11 +178,11 @@ class TestSamplerV2(QiskitAerTestCase):
         pqc2, param2, target2 = self._cases[5]
         pqc3, param3, target3 = self._cases[6]
 
-        sampler = SamplerV2(seed=self._seed)
+        sampler = self._sampler
         result = sampler.run(
             [(pqc1, param1), (pqc2, param2), (pqc3, param3)], shots=self._shots
         ).result()
-        self.assertEqual(len(result), 3)
+        self._assert_standard_result(result, 3)
         self._assert_allclose(result[0].data.meas, np.array(target1))
         self._assert_allclose(result[1].data.meas, np.array(target2))
         self._assert_allclose(result[2].data.meas, np.array(target3))
@@ -177,11 +195,11 @@ class TestSamplerV2(QiskitAerTestCase):
         qc2.x(0)
         qc2.measure_all()
 
-        sampler = SamplerV2(seed=self._seed)
-        result = sampler.run([qc, qc2], shots=self._shots).result()
+        sampler = self._sampler
+        result = sampler.run([qc, qc2], shots=self._shots_exact).result()
         self.assertEqual(len(result), 2)
         for i in range(2):
-            self._assert_allclose(result[i].data.meas, np.array({i: self._shots}))
+            self._assert_allclose(result[i].data.meas, np.array({i: self._shots_exact}), rtol=0)
 
     def test_run_2qubit(self):
         """test for 2-qubit cases"""
@@ -197,11 +215,11 @@ class TestSamplerV2(QiskitAerTestCase):
         qc3.x([0, 1])
         qc3.measure_all()
 
-        sampler = SamplerV2(seed=self._seed)
-        result = sampler.run([qc0, qc1, qc2, qc3], shots=self._shots).result()
+        sampler = self._sampler
+        result = sampler.run([qc0, qc1, qc2, qc3], shots=self._shots_exact).result()
         self.assertEqual(len(result), 4)
         for i in range(4):
-            self._assert_allclose(result[i].data.meas, np.array({i: self._shots}))
+            self._assert_allclose(result[i].data.meas, np.array({i: self._shots_exact}), rtol=0)
 
     def test_run_single_circuit(self):
         """Test for single circuit case."""
@@ -214,49 +232,59 @@ class TestSamplerV2(QiskitAerTestCase):
             ]
             for param, target in param_target:
                 with self.subTest(f"{circuit.name} w/ {param}"):
-                    sampler = SamplerV2(seed=self._seed)
+                    sampler = self._sampler
                     result = sampler.run([(circuit, param)], shots=self._shots).result()
                     self.assertEqual(len(result), 1)
                     self._assert_allclose(result[0].data.meas, target)
 
+        # the following subtests only check how parameter values are normalized,
+        # so they run with a small number of shots
+        shots = 16
+
         with self.subTest("One parameter"):
             circuit = QuantumCircuit(1, 1, name="X gate")
             param = Parameter("x")
             circuit.ry(param, 0)
             circuit.measure(0, 0)
             param_target = [
-                ({"x": np.pi}, np.array({1: self._shots})),
-                ({param: np.pi}, np.array({1: self._shots})),
-                ({"x": np.array(np.pi)}, np.array({1: self._shots})),
-                ({param: np.array(np.pi)}, np.array({1: self._shots})),
-                ({"x": [np.pi]}, np.array({1: self._shots})),
-                ({param: [np.pi]}, np.array({1: self._shots})),
-                ({"x": np.array([np.pi])}, np.array({1: self._shots})),
-                ({param: np.array([np.pi])}, np.array({1: self._shots})),
+                ({"x": np.pi}, np.array({1: shots})),
+                ({param: np.pi}, np.array({1: shots})),
+                ({"x": np.array(np.pi)}, np.array({1: shots})),
+                ({param: np.array(np.pi)}, np.array({1: shots})),
+                ({"x": [np.pi]}, np.array({1: shots})),
+                ({param: [np.pi]}, np.array({1: shots})),
+                ({"x": np.array([np.pi])}, np.array({1: shots})),
+                ({param: np.array([np.pi])}, np.array({1: shots})),
             ]
             for param, target in param_target:
                 with self.subTest(f"{circuit.name} w/ {param}"):
-                    sampler = SamplerV2(seed=self._seed)
-                    result = sampler.run([(circuit, param)], shots=self._shots).result()
+                    sampler = self._sampler
+                    result = sampler.run([(circuit, param)], shots=shots).result()
                     self.assertEqual(len(result), 1)
-                    self._assert_allclose(result[0].data.c, target)
+                    self._assert_allclose(result[0].data.c, target, rtol=0)
 
         with self.subTest("More than one parameter"):
             circuit, param, target = self._cases[3]
-            param_target = [
-                (param, np.array(target)),
-                (tuple(param), np.array(target)),
-                (np.array(param), np.array(target)),
-                ((param,), np.array([target])),
-                ([param], np.array([target])),
-                (np.array([param]), np.array([target])),
+            sampler = self._sampler
+            result = sampler.run([(circuit, param)], shots=self._shots).result()
+            self.assertEqual(len(result), 1)
+            self._assert_allclose(result[0].data.meas, np.array(target))
+
+            reference = sampler.run([(circuit, param)], shots=shots).result()[0].data.meas
+            param_shape = [
+                (param, ()),
+                (tuple(param), ()),
+                (np.array(param), ()),
+                ((param,), (1,)),
+                ([param], (1,)),
+                (np.array([param]), (1,)),
             ]
-            for param, target in param_target:
+            for param, shape in param_shape:
                 with self.subTest(f"{circuit.name} w/ {param}"):
-                    sampler = SamplerV2(seed=self._seed)
-                    result = sampler.run([(circuit, param)], shots=self._shots).result()
+                    result = sampler.run([(circuit, param)], shots=shots).result()
                     self.assertEqual(len(result), 1)
-                    self._assert_allclose(result[0].data.meas, target)
+                    self.assertEqual(result[0].data.meas.num_shots, shots)
+                    self._assert_allclose(result[0].data.meas, reference.reshape(shape), rtol=0)
 
     def test_run_reverse_meas_order(self):
         """test for sampler with reverse measurement order"""
@@ -271,107 +299,90 @@ class TestSamplerV2(QiskitAerTestCase):
         qc.measure(1, 1)
         qc.measure(2, 0)
 
-        sampler = SamplerV2(seed=self._seed)
-        result = sampler.run([(qc, [0, 0]), (qc, [np.pi / 2, 0])], shots=self._shots).result()
+        sampler = self._sampler
+        result = sampler.run([(qc, [0, 0]), (qc, [np.pi / 2, 0])], shots=self._shots_fast).result()
         self.assertEqual(len(result), 2)
 
         # qc({x: 0, y: 0})
-        self._assert_allclose(result[0].data.c, np.array({1: self._shots}))
+        self._assert_allclose(result[0].data.c, np.array({1: self._shots_fast}))
 
         # qc({x: pi/2, y: 0})
-        self._assert_allclose(result[1].data.c, np.array({1: self._shots / 2, 5: self._shots / 2}))
+        self._assert_allclose(
+            result[1].data.c, np.array({1: self._shots_fast / 2, 5: self._shots_fast / 2})
+        )
 
     def test_run_errors(self):
         """Test for errors with run method"""
-        qc1 = QuantumCircuit(1)
-        qc1.measure_all()
-        qc2 = RealAmplitudes(num_qubits=1, reps=1)
-        qc2.measure_all()
-        qc3 = QuantumCircuit(1, 1)
-        with qc3.for_loop(range(5)):
-            qc3.h(0)
-
-        pm = generate_preset_pass_manager(optimization_level=0, backend=self._backend)
-        qc1, qc2, qc3 = pm.run([qc1, qc2, qc3])
-
-        sampler = SamplerV2()
-        with self.subTest("set parameter values to a non-parameterized circuit"):
-            with self.assertRaises(ValueError):
-                _ = sampler.run([(qc1, [1e2])]).result()
-        with self.subTest("missing all parameter values for a parameterized circuit"):
-            with self.assertRaises(ValueError):
-                _ = sampler.run([qc2]).result()
-            with self.assertRaises(ValueError):
-                _ = sampler.run([(qc2, [])]).result()
-            with self.assertRaises(ValueError):
-                _ = sampler.run([(qc2, None)]).result()
-        with self.subTest("missing some parameter values for a parameterized circuit"):
-            with self.assertRaises(ValueError):
-                _ = sampler.run([(qc2, [1e2])]).result()
-        with self.subTest("too many parameter values for a parameterized circuit"):
-            with self.assertRaises(ValueError):
-                _ = sampler.run([(qc2, [1e2] * 100)]).result()
-        with self.subTest("with control flow"):
-            with self.assertRaises(QiskitError):
-                _ = sampler.run([qc3]).result()
-        with self.subTest("negative shots, run arg"):
-            with self.assertRaises(ValueError):
-                _ = sampler.run([qc1], shots=-1).result()
-        with self.subTest("negative shots, pub-like"):
-            with self.assertRaises(ValueError):
-                _ = sampler.run([(qc1, None, -1)]).result()
-        with self.subTest("negative shots, pub"):
-            with self.assertRaises(ValueError):
-                _ = sampler.run([SamplerPub(qc1, shots=-1)]).result()
-        with self.subTest("zero shots, run arg"):
-            with self.assertRaises(ValueError):
-                _ = sampler.run([qc1], shots=0).result()
-        with self.subTest("zero shots, pub-like"):
-            with self.assertRaises(ValueError):
-                _ = sampler.run([(qc1, None, 0)]).result()
-        with self.subTest("zero shots, pub"):
-            with self.assertRaises(ValueError):
-                _ = sampler.run([SamplerPub(qc1, shots=0)]).result()
+        qc1, qc2, qc3 = self._error_circuits
+
+        # (label, pubs, shots, expected exception)
+        cases = [
+            (
+                "set parameter values to a non-parameterized circuit",
+                [(qc1, [1e2])],
+                None,
+                ValueError,
+            ),
+            ("missing all parameter values, no values", [qc2], None, ValueError),
+            ("missing all parameter values, empty list", [(qc2, [])], None, ValueError),
+            ("missing all parameter values, None", [(qc2, None)], None, ValueError),
+            ("missing some parameter values", [(qc2, [1e2])], None, ValueError),
+            ("too many parameter values", [(qc2, [1e2] * 100)], None, ValueError),
+            ("with control flow", [qc3], None, QiskitError),
+            ("negative shots, run arg", [qc1], -1, ValueError),
+            ("negative shots, pub-like", [(qc1, None, -1)], None, ValueError),
+            ("zero shots, run arg", [qc1], 0, ValueError),
+            ("zero shots, pub-like", [(qc1, None, 0)], None, ValueError),
+        ]
+
+        sampler = self._sampler
+        for title, pubs, shots, error in cases:
+            with self.subTest(title):
+                with self.assertRaises(error):
+                    _ = sampler.run(pubs, shots=shots).result()
+
+        # SamplerPub validates its shots on construction
+        for title, shots in [("negative shots, pub", -1), ("zero shots, pub", 0)]:
+            with self.subTest(title):
+                with self.assertRaises(ValueError):
+                    _ = sampler.run([SamplerPub(qc1, shots=shots)]).result()
 
     def test_run_empty_parameter(self):
         """Test for empty parameter"""
         n = 5
         qc = QuantumCircuit(n, n - 1)
         qc.measure(range(n - 1), range(n - 1))
-        sampler = SamplerV2(seed=self._seed)
+        sampler = self._sampler
         with self.subTest("one circuit"):
-            result = sampler.run([qc], shots=self._shots).result()
+            result = sampler.run([qc], shots=self._shots_exact).result()
             self.assertEqual(len(result), 1)
-            self._assert_allclose(result[0].data.c, np.array({0: self._shots}))
+            self._assert_allclose(result[0].data.c, np.array({0: self._shots_exact}), rtol=0)
 
         with self.subTest("two circuits"):
-            result = sampler.run([qc, qc], shots=self._shots).result()
+            result = sampler.run([qc, qc], shots=self._shots_exact).result()
             self.assertEqual(len(result), 2)
             for i in range(2):
-                self._assert_allclose(result[i].data.c, np.array({0: self._shots}))
+                self._assert_allclose(result[i].data.c, np.array({0: self._shots_exact}), rtol=0)
 
     def test_run_numpy_params(self):
         """Test for numpy array as parameter values"""
-        qc = RealAmplitudes(num_qubits=2, reps=2)
-        qc.measure_all()
-        pm = generate_preset_pass_manager(optimization_level=0, backend=self._backend)
-        qc = pm.run(qc)
+        qc, _, _ = self._cases[2]
         k = 5
         params_array = np.linspace(0, 1, k * qc.num_parameters).reshape((k, qc.num_parameters))
         params_list = params_array.tolist()
-        sampler = SamplerV2(seed=self._seed)
-        target = sampler.run([(qc, params_list)], shots=self._shots).result()
+        sampler = self._sampler
+        target = sampler.run([(qc, params_list)], shots=self._shots_fast).result()
 
         with self.subTest("ndarray"):
-            sampler = SamplerV2(seed=self._seed)
-            result = sampler.run([(qc, params_array)], shots=self._shots).result()
+            sampler = self._sampler
+            result = sampler.run([(qc, params_array)], shots=self._shots_fast).result()
             self.assertEqual(len(result), 1)
             self._assert_allclose(result[0].data.meas, target[0].data.meas)
 
         with self.subTest("split a list"):
-            sampler = SamplerV2(seed=self._seed)
+            sampler = self._sampler
             result = sampler.run(
-                [(qc, params) for params in params_list], shots=self._shots
+                [(qc, params) for params in params_list], shots=self._shots_fast
             ).result()
             self.assertEqual(len(result), k)
             for i in range(k):
@@ -385,7 +396,7 @@ class TestSamplerV2(QiskitAerTestCase):
         shots = 100
 
         with self.subTest("run arg"):
-            sampler = SamplerV2(seed=self._seed)
+            sampler = self._sampler
             result = sampler.run([bell], shots=shots).result()
             self.assertEqual(len(result), 1)
             self.assertEqual(result[0].data.meas.num_shots, shots)
@@ -394,7 +405,7 @@ class TestSamplerV2(QiskitAerTestCase):
             self.assertEqual(result[0].metadata["shots"], shots)
 
         with self.subTest("default shots"):
-            sampler = SamplerV2(seed=self._seed)
+            sampler = self._sampler
             default_shots = sampler.default_shots
             result = sampler.run([bell]).result()
             self.assertEqual(len(result), 1)
@@ -415,7 +426,7 @@ class TestSamplerV2(QiskitAerTestCase):
             self.assertEqual(result[0].metadata["shots"], default_shots)
 
         with self.subTest("pub-like"):
-            sampler = SamplerV2(seed=self._seed)
+            sampler = self._sampler
             result = sampler.run([(bell, None, shots)]).result()
             self.assertEqual(len(result), 1)
             self.assertEqual(result[0].data.meas.num_shots, shots)
@@ -424,7 +435,7 @@ class TestSamplerV2(QiskitAerTestCase):
             self.assertEqual(result[0].metadata["shots"], shots)
 
         with self.subTest("pub"):
-            sampler = SamplerV2(seed=self._seed)
+            sampler = self._sampler
             result = sampler.run([SamplerPub(bell, shots=shots)]).result()
             self.assertEqual(len(result), 1)
             self.assertEqual(result[0].data.meas.num_shots, shots)
@@ -433,7 +444,7 @@ class TestSamplerV2(QiskitAerTestCase):
             self.assertEqual(result[0].metadata["shots"], shots)
 
         with self.subTest("multiple pubs"):
-            sampler = SamplerV2(seed=self._seed)
+            sampler = self._sampler
             shots1 = 100
             shots2 = 200
             result = sampler.run(
@@ -457,20 +468,22 @@ class TestSamplerV2(QiskitAerTestCase):
     def test_run_shots_result_size(self):
         """test with shots option to validate the result size"""
         n = 10
+        # fewer shots than outcomes, so most samples are distinct bitstrings
+        shots = 512
         qc = QuantumCircuit(n)
         qc.h(range(n))
         qc.measure_all()
-        sampler = SamplerV2(seed=self._seed)
-        result = sampler.run([qc], shots=self._shots).result()
+        sampler = self._sampler
+        result = sampler.run([qc], shots=shots).result()
         self.assertEqual(len(result), 1)
-        self.assertLessEqual(result[0].data.meas.num_shots, self._shots)
-        self.assertEqual(sum(result[0].data.meas.get_counts().values()), self._shots)
+        self.assertLessEqual(result[0].data.meas.num_shots, shots)
+        self.assertEqual(sum(result[0].data.meas.get_counts().values()), shots)
 
     def test_primitive_job_status_done(self):
         """test primitive job's status"""
         bell, _, _ = self._cases[1]
-        sampler = SamplerV2(seed=self._seed)
-        job = sampler.run([bell], shots=self._shots)
+        sampler = self._sampler
+        job = sampler.run([bell], shots=self._shots_fast)
         _ = job.result()
         self.assertEqual(job.status(), JobStatus.DONE)
 
@@ -489,29 +502,23 @@ class TestSamplerV2(QiskitAerTestCase):
     def test_circuit_with_unitary(self):
         """Test for circuit with unitary gate."""
 
-        with self.subTest("identity"):
-            gate = UnitaryGate(np.eye(2))
-
-            circuit = QuantumCircuit(1)
-            circuit.append(gate, [0])
-            circuit.measure_all()
+        circuit_id = QuantumCircuit(1)
+        circuit_id.append(UnitaryGate(np.eye(2)), [0])
+        circuit_id.measure_all()
 
-            sampler = SamplerV2(seed=self._seed)
-            result = sampler.run([circuit], shots=self._shots).result()
-            self.assertEqual(len(result), 1)
-            self._assert_allclose(result[0].data.meas, np.array({0: self._shots}))
+        circuit_x = QuantumCircuit(1)
+        circuit_x.append(UnitaryGate([[0, 1], [1, 0]]), [0])
+        circuit_x.measure_all()
 
-        with self.subTest("X"):
-            gate = UnitaryGate([[0, 1], [1, 0]])
+        sampler = self._sampler
+        result = sampler.run([circuit_id, circuit_x], shots=self._shots_fast).result()
+        self.assertEqual(len(result), 2)
 
-            circuit = QuantumCircuit(1)
-            circuit.append(gate, [0])
-            circuit.measure_all()
+        with self.subTest("identity"):
+            self._assert_allclose(result[0].data.meas, np.array({0: self._shots_fast}))
 
-            sampler = SamplerV2(seed=self._seed)
-            result = sampler.run([circuit], shots=self._shots).result()
-            self.assertEqual(len(result), 1)
-            self._assert_allclose(result[0].data.meas, np.array({1: self._shots}))
+        with self.subTest("X"):
+            self._assert_allclose(result[1].data.meas, np.array({1: self._shots_fast}))
 
     def get_data_bin_len(self, data):
         if "keys" in dir(data):  # qiskit 1.1 or later
@@ -581,12 +588,12 @@ class TestSamplerV2(QiskitAerTestCase):
         target = {"a": {0: 10000}, "b": {0: 10000}, "c": {0: 10000}}
         cases.append(("no measure", qc, target))
 
-        for title, qc, target in cases:
+        sampler = self._sampler
+        result = sampler.run([qc for _, qc, _ in cases], shots=self._shots).result()
+        self.assertEqual(len(result), len(cases))
+        for i, (title, qc, target) in enumerate(cases):
             with self.subTest(title):
-                sampler = SamplerV2(seed=self._seed)
-                result = sampler.run([qc], shots=self._shots).result()
-                self.assertEqual(len(result), 1)
-                data = result[0].data
+                data = result[i].data
                 self.assertEqual(self.get_data_bin_len(data), 3)
                 for creg in qc.cregs:
                     self.assertTrue(hasattr(data, creg.name))
@@ -616,7 +623,7 @@ class TestSamplerV2(QiskitAerTestCase):
             cregs[2]: {0: 8500, 1: 1500},
         }
 
-        sampler = SamplerV2(seed=self._seed)
+        sampler = self._sampler
         result = sampler.run([qc2], shots=self._shots).result()
         self.assertEqual(len(result), 1)
         data = result[0].data
@@ -628,13 +635,33 @@ class TestSamplerV2(QiskitAerTestCase):
     def test_no_cregs(self):
         """Test that the sampler works when there are no classical register in the circuit."""
         qc = QuantumCircuit(2)
-        sampler = SamplerV2()
+        sampler = self._sampler
         with self.assertWarns(UserWarning):
-            result = sampler.run([qc]).result()
+            result = sampler.run([qc], shots=self._shots_exact).result()
 
         self.assertEqual(len(result), 1)
         self.assertEqual(len(result[0].data), 0)
 
 
+def _packed_to_ints(array: NDArray[np.uint8]) -> NDArray[np.int64]:
+    """Return the integer outcome of each row of a big-endian packed ``(shots, num_bytes)`` array."""
+    weights = np.left_shift(1, 8 * np.arange(array.shape[-1] - 1, -1, -1, dtype=np.int64))
+    return array.astype(np.int64) @ weights
+
+
+def _histogram(array: NDArray[np.uint8], size: int) -> NDArray[np.int64]:
+    """Return the outcome counts of a packed ``(shots, num_bytes)`` array as a dense histogram."""
+    return np.bincount(_packed_to_ints(array), minlength=size)
+
+
+def _counts_to_array(counts: dict[int, float], size: int) -> NDArray[np.float64]:
+    """Return a dense histogram of length ``size`` from integer-keyed counts."""
+    ary = np.zeros(size)
+    ary[np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))] = np.fromiter(
+        counts.values(), dtype=np.float64, count=len(counts)
+    )
+    return ary
+
+
 if __name__ == "__main__":
     unittest.main()